@@ -12,6 +12,7 @@ setup(
         "uvicorn>=0.15.0",
         "fastapi>=0.68.0",
         "typing_extensions>=4.5.0",
+        "orjson>=3.8.0",
     ],
     entry_points={
         "console_scripts": [
@@ -1,5 +1,5 @@
 import asyncio
-import json
+import orjson
 import websockets
 from typing import Callable, Any, Dict, Optional
 import logging
@@ -33,20 +33,20 @@ class Server:
         async def handler(websocket, path):
             self.websocket = websocket
             try:
-                logger.info(f"New WebSocket connection from {websocket.remote_address}")
+                logger.info("New WebSocket connection from %s", websocket.remote_address)
                 async for message in websocket:
                     response = None
                     try:
                         # Parse JSON-RPC message
-                        data = json.loads(message)
+                        data = orjson.loads(message)
                         if not isinstance(data, dict):
                             raise ValueError("Invalid JSON-RPC message")
                             
                         # Handle message
                         response = await self.handle_jsonrpc(data)
                         
-                    except json.JSONDecodeError as e:
-                        logger.error(f"JSON decode error: {str(e)}")
+                    except orjson.JSONDecodeError as e:
+                        logger.error("JSON decode error: %s", e)
                         response = {
                             "jsonrpc": "2.0",
                             "error": {
@@ -58,7 +58,7 @@ class Server:
                         }
                         
                     except Exception as e:
-                        logger.error(f"Error handling message: {str(e)}", exc_info=True)
+                        logger.error("Error handling message: %s", e, exc_info=True)
                         response = {
                             "jsonrpc": "2.0",
                             "error": {
@@ -83,11 +83,11 @@ class Server:
                                 response["id"] = data["id"]
                                 
                             # Validate JSON before sending
-                            response_str = json.dumps(response)
+                            response_str = orjson.dumps(response).decode()
                             await websocket.send(response_str)
                             
                         except Exception as e:
-                            logger.error(f"Error sending response: {str(e)}", exc_info=True)
+                            logger.error("Error sending response: %s", e, exc_info=True)
                             error_response = {
                                 "jsonrpc": "2.0",
                                 "error": {
@@ -97,7 +97,7 @@ class Server:
                                 },
                                 "id": data.get("id") if isinstance(data, dict) else None
                             }
-                            await websocket.send(json.dumps(error_response))
+                            await websocket.send(orjson.dumps(error_response).decode())
                         
             except websockets.exceptions.ConnectionClosed:
                 logger.info("WebSocket connection closed")
@@ -112,9 +112,9 @@ class Server:
                 ping_interval=20,
                 ping_timeout=20
             )
-            logger.info(f"Server started on ws://{host}:{port}")
+            logger.info("Server started on ws://%s:%s", host, port)
         except Exception as e:
-            logger.error(f"Failed to start server: {str(e)}", exc_info=True)
+            logger.error("Failed to start server: %s", e, exc_info=True)
             raise
         
     async def handle_jsonrpc(self, data: Dict) -> Optional[Dict]:
@@ -130,7 +130,7 @@ class Server:
             method = data.get("method")
             params = data.get("params", {})
             
-            logger.info(f"Handling method: {method} with params: {params}")
+            logger.info("Handling method: %s with params: %s", method, params)
             
             if method == "initialize":
                 self.capabilities = params.get("capabilities", {})
@@ -159,7 +159,7 @@ class Server:
                         )
                         return {"result": result}
                     except Exception as e:
-                        logger.error(f"Error in input request handler: {str(e)}", exc_info=True)
+                        logger.error("Error in input request handler: %s", e, exc_info=True)
                         return {
                             "error": {
                                 "code": -32000,
@@ -177,7 +177,7 @@ class Server:
                         await handler(params)
                         return {"result": None}
                     except Exception as e:
-                        logger.error(f"Error in input response handler: {str(e)}", exc_info=True)
+                        logger.error("Error in input response handler: %s", e, exc_info=True)
                         return {
                             "error": {
                                 "code": -32000,
@@ -196,7 +196,7 @@ class Server:
             }
             
         except Exception as e:
-            logger.error(f"Error in handle_jsonrpc: {str(e)}", exc_info=True)
+            logger.error("Error in handle_jsonrpc: %s", e, exc_info=True)
             return {
                 "error": {
                     "code": -32603,
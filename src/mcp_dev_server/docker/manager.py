@@ -1,5 +1,7 @@
 """Docker integration for MCP Development Server."""
 import asyncio
+import functools
+import hashlib
 import docker
 from typing import Dict, Any, Optional, List
 from pathlib import Path
@@ -12,21 +14,68 @@ from ..utils.errors import MCPDevServerError
 
 logger = setup_logging(__name__)
 
+# Seconds between one-shot stats samples pumped into the cache
+STATS_POLL_INTERVAL = 2.0
+
+_shared_client: Optional[docker.DockerClient] = None
+
+def get_docker_client() -> docker.DockerClient:
+    """Get the shared Docker client.
+
+    docker-py pools its HTTP connections per client, so every manager
+    reuses one client (and its keep-alive connections to the daemon)
+    instead of opening its own.
+
+    Returns:
+        docker.DockerClient: Shared client instance
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = docker.from_env()
+    return _shared_client
+
+@functools.lru_cache(maxsize=None)
+def container_name(environment: str) -> str:
+    """Resolve the container name for an environment.
+
+    Args:
+        environment: Environment name
+
+    Returns:
+        str: Container name
+    """
+    return f"mcp-{environment}"
+
 class DockerManager:
     """Manages Docker containers and environments."""
     
     def __init__(self):
         """Initialize Docker manager."""
-        self.client = docker.from_env()
+        self._client: Optional[docker.DockerClient] = None
         self.active_containers: Dict[str, Any] = {}
+        self._stats_cache: Dict[str, dict] = {}
+        self._stats_tasks: Dict[str, asyncio.Task] = {}
         self._setup_template_environment()
+
+    @property
+    def client(self) -> docker.DockerClient:
+        """Shared Docker client, connected on first use."""
+        if self._client is None:
+            self._client = get_docker_client()
+        return self._client
         
     def _setup_template_environment(self):
         """Set up Jinja2 template environment."""
         template_dir = Path(__file__).parent / "templates"
+
+        # Persist compiled templates so repeated loads skip recompilation
+        cache_dir = Path(tempfile.gettempdir()) / "mcp-dev-server" / "jinja-cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
         self.template_env = jinja2.Environment(
             loader=jinja2.FileSystemLoader(str(template_dir)),
-            autoescape=jinja2.select_autoescape()
+            autoescape=jinja2.select_autoescape(),
+            bytecode_cache=jinja2.FileSystemBytecodeCache(str(cache_dir))
         )
         
     async def create_environment(
@@ -52,13 +101,15 @@ class DockerManager:
             str: Environment ID
         """
         try:
+            loop = asyncio.get_running_loop()
+
             # Ensure image is available
             try:
-                self.client.images.get(image)
+                await loop.run_in_executor(None, self.client.images.get, image)
             except docker.errors.ImageNotFound:
-                logger.info(f"Pulling image: {image}")
-                self.client.images.pull(image)
-                
+                logger.info("Pulling image: %s", image)
+                await loop.run_in_executor(None, self.client.images.pull, image)
+
             # Setup default volumes
             container_volumes = {
                 project_path: {
@@ -68,17 +119,21 @@ class DockerManager:
             }
             if volumes:
                 container_volumes.update(volumes)
-                
+
             # Create container
-            container = self.client.containers.run(
-                image=image,
-                name=f"mcp-env-{name}",
-                detach=True,
-                volumes=container_volumes,
-                environment=env_vars or {},
-                ports=ports or {},
-                working_dir="/workspace",
-                remove=True
+            container = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self.client.containers.run,
+                    image=image,
+                    name=f"mcp-env-{name}",
+                    detach=True,
+                    volumes=container_volumes,
+                    environment=env_vars or {},
+                    ports=ports or {},
+                    working_dir="/workspace",
+                    remove=True
+                )
             )
             
             env_id = container.id
@@ -88,13 +143,224 @@ class DockerManager:
                 "status": "running"
             }
             
-            logger.info(f"Created environment: {name} ({env_id})")
+            logger.info("Created environment: %s (%s)", name, env_id)
             return env_id
             
         except Exception as e:
-            logger.error(f"Failed to create environment: {str(e)}")
+            logger.error("Failed to create environment: %s", e)
             raise MCPDevServerError(f"Environment creation failed: {str(e)}")
             
+    async def create_container(
+        self,
+        project_path: str,
+        environment: str,
+        dockerfile: str,
+        volumes: Optional[Dict[str, Dict[str, str]]] = None,
+        environment_vars: Optional[Dict[str, str]] = None,
+        ports: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Create a container for a development environment.
+
+        Args:
+            project_path: Project directory path
+            environment: Environment name
+            dockerfile: Path to the environment Dockerfile
+            volumes: Additional volume mappings
+            environment_vars: Environment variables
+            ports: Port mappings
+
+        Returns:
+            str: Container ID
+        """
+        try:
+            loop = asyncio.get_running_loop()
+
+            # Tag images by Dockerfile content so unchanged environments
+            # skip the build entirely.
+            name = container_name(environment)
+            dockerfile_path = Path(dockerfile)
+            digest = hashlib.sha256(dockerfile_path.read_bytes()).hexdigest()[:12]
+            image_tag = f"{name}:{digest}"
+
+            try:
+                image = await loop.run_in_executor(
+                    None, self.client.images.get, image_tag
+                )
+            except docker.errors.ImageNotFound:
+                # Seed the layer cache from any earlier build of this
+                # environment.
+                previous_images = await loop.run_in_executor(
+                    None,
+                    functools.partial(self.client.images.list, name=name)
+                )
+                cache_from = [tag for img in previous_images for tag in img.tags]
+
+                image, _ = await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        self.client.images.build,
+                        path=str(dockerfile_path.parent),
+                        dockerfile=dockerfile_path.name,
+                        tag=image_tag,
+                        cache_from=cache_from or None,
+                        rm=True
+                    )
+                )
+
+            # Setup default volumes
+            container_volumes = {
+                project_path: {
+                    "bind": "/workspace",
+                    "mode": "rw"
+                }
+            }
+            if volumes:
+                container_volumes.update(volumes)
+
+            container = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self.client.containers.run,
+                    image=image.id,
+                    name=name,
+                    detach=True,
+                    volumes=container_volumes,
+                    environment=environment_vars or {},
+                    ports=ports or {},
+                    working_dir="/workspace",
+                    remove=True
+                )
+            )
+
+            self.active_containers[environment] = {
+                "name": environment,
+                "container_name": name,
+                "container": container,
+                "status": "running",
+                # Static details captured once so status queries never
+                # re-fetch container attrs from the daemon
+                "details": {
+                    "id": container.id,
+                    "image": image_tag,
+                    "created": container.attrs.get("Created")
+                }
+            }
+
+            # Keep a long-lived stats stream per container so status queries
+            # read from the cache instead of blocking on the stats API.
+            self._stats_tasks[environment] = asyncio.create_task(
+                self._pump_stats(environment, container)
+            )
+
+            logger.info("Created container for environment: %s", environment)
+            return container.id
+
+        except Exception as e:
+            logger.error("Failed to create container: %s", e)
+            raise MCPDevServerError(f"Container creation failed: {str(e)}")
+
+    async def _pump_stats(self, environment: str, container) -> None:
+        """Pump one-shot stats samples for a container into the cache.
+
+        The one-shot endpoint returns cumulative counters immediately
+        instead of sampling on the daemon for ~1s per request; rates are
+        derived client-side from the previous snapshot.
+
+        Args:
+            environment: Environment name
+            container: Container instance
+        """
+        loop = asyncio.get_running_loop()
+        previous: Optional[dict] = None
+        try:
+            while True:
+                sample = await loop.run_in_executor(
+                    None,
+                    lambda: container.stats(stream=False, one_shot=True)
+                )
+                sample["cpu_percent"] = self._calculate_cpu_percent(previous, sample)
+                self._stats_cache[environment] = sample
+                previous = sample
+                await asyncio.sleep(STATS_POLL_INTERVAL)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Stats polling ended for %s: %s", environment, e)
+
+    @staticmethod
+    def _calculate_cpu_percent(previous: Optional[dict], sample: dict) -> float:
+        """Compute CPU usage percentage from two cumulative-counter samples.
+
+        Args:
+            previous: Previous stats snapshot, if any
+            sample: Current stats snapshot
+
+        Returns:
+            float: CPU usage percentage
+        """
+        if not previous:
+            return 0.0
+
+        try:
+            cpu_delta = (
+                sample["cpu_stats"]["cpu_usage"]["total_usage"]
+                - previous["cpu_stats"]["cpu_usage"]["total_usage"]
+            )
+            system_delta = (
+                sample["cpu_stats"]["system_cpu_usage"]
+                - previous["cpu_stats"]["system_cpu_usage"]
+            )
+            if system_delta > 0 and cpu_delta >= 0:
+                online_cpus = sample["cpu_stats"].get("online_cpus", 1)
+                return (cpu_delta / system_delta) * online_cpus * 100.0
+        except (KeyError, TypeError):
+            pass
+
+        return 0.0
+
+    async def get_container_status(self, environment: str) -> Dict[str, Any]:
+        """Get container status for an environment.
+
+        Args:
+            environment: Environment name
+
+        Returns:
+            Dict[str, Any]: Container status and latest stats sample
+        """
+        if environment not in self.active_containers:
+            raise MCPDevServerError(f"Environment not found: {environment}")
+
+        info = self.active_containers[environment]
+        return {
+            "status": info["status"],
+            "details": info["details"],
+            "stats": self._stats_cache.get(environment, {})
+        }
+
+    async def stop_container(self, environment: str) -> None:
+        """Stop and remove an environment container.
+
+        Args:
+            environment: Environment name
+        """
+        try:
+            if environment not in self.active_containers:
+                raise MCPDevServerError(f"Environment not found: {environment}")
+
+            if task := self._stats_tasks.pop(environment, None):
+                task.cancel()
+            self._stats_cache.pop(environment, None)
+
+            container = self.active_containers[environment]["container"]
+            await asyncio.get_running_loop().run_in_executor(None, container.stop)
+            del self.active_containers[environment]
+
+            logger.info("Stopped container for environment: %s", environment)
+
+        except Exception as e:
+            logger.error("Failed to stop container: %s", e)
+            raise MCPDevServerError(f"Container stop failed: {str(e)}")
+
     async def generate_dockerfile(
         self,
         template: str,
@@ -122,7 +388,7 @@ class DockerManager:
             return content
             
         except Exception as e:
-            logger.error(f"Failed to generate Dockerfile: {str(e)}")
+            logger.error("Failed to generate Dockerfile: %s", e)
             raise MCPDevServerError(f"Dockerfile generation failed: {str(e)}")
             
     async def create_compose_config(
@@ -161,72 +427,114 @@ class DockerManager:
             return content
             
         except Exception as e:
-            logger.error(f"Failed to create Docker Compose config: {str(e)}")
+            logger.error("Failed to create Docker Compose config: %s", e)
             raise MCPDevServerError(f"Compose config creation failed: {str(e)}")
             
     async def execute_command(
         self,
-        env_id: str,
+        environment: str,
         command: str,
-        workdir: Optional[str] = None,
-        stream: bool = False
+        workdir: Optional[str] = None
     ) -> Dict[str, Any]:
         """Execute command in Docker environment.
-        
+
         Args:
-            env_id: Environment ID
+            environment: Environment name
             command: Command to execute
             workdir: Working directory
-            stream: Stream output in real-time
-            
+
         Returns:
             Dict[str, Any]: Command execution results
         """
         try:
-            if env_id not in self.active_containers:
-                raise MCPDevServerError(f"Environment not found: {env_id}")
-                
-            container = self.active_containers[env_id]["container"]
-            exec_result = container.exec_run(
-                command,
-                workdir=workdir or "/workspace",
-                stream=True
-            )
-            
-            if stream:
-                output = []
-                for line in exec_result.output:
-                    decoded_line = line.decode().strip()
-                    output.append(decoded_line)
-                    yield decoded_line
-                    
-                return {
-                    "exit_code": exec_result.exit_code,
-                    "output": output
-                }
-            else:
+            if environment not in self.active_containers:
+                raise MCPDevServerError(f"Environment not found: {environment}")
+
+            container = self.active_containers[environment]["container"]
+
+            def run_exec() -> Dict[str, Any]:
+                exec_result = container.exec_run(
+                    command,
+                    workdir=workdir or "/workspace",
+                    stream=True
+                )
+
                 output = []
                 for line in exec_result.output:
                     output.append(line.decode().strip())
-                    
+
                 return {
                     "exit_code": exec_result.exit_code,
                     "output": output
                 }
-                
+
+            return await asyncio.get_running_loop().run_in_executor(None, run_exec)
+
         except Exception as e:
-            logger.error(f"Command execution failed: {str(e)}")
+            logger.error("Command execution failed: %s", e)
             raise MCPDevServerError(f"Command execution failed: {str(e)}")
+
+    async def stream_command(
+        self,
+        environment: str,
+        command: str,
+        workdir: Optional[str] = None
+    ):
+        """Stream command output from a Docker environment.
+
+        Yields each output line as the container produces it instead of
+        buffering the full result in memory.
+
+        Args:
+            environment: Environment name
+            command: Command to execute
+            workdir: Working directory
+
+        Yields:
+            str: Decoded output lines
+        """
+        try:
+            if environment not in self.active_containers:
+                raise MCPDevServerError(f"Environment not found: {environment}")
+
+            container = self.active_containers[environment]["container"]
+            loop = asyncio.get_running_loop()
+
+            exec_result = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    container.exec_run,
+                    command,
+                    workdir=workdir or "/workspace",
+                    stream=True
+                )
+            )
+
+            output = exec_result.output
+            while True:
+                line = await loop.run_in_executor(None, next, output, None)
+                if line is None:
+                    break
+                yield line.decode().strip()
+
+        except Exception as e:
+            logger.error("Command streaming failed: %s", e)
+            raise MCPDevServerError(f"Command streaming failed: {str(e)}")
             
     async def cleanup(self):
         """Clean up Docker resources."""
-        try:
-            for env_id in list(self.active_containers.keys()):
-                await self.destroy_environment(env_id)
-                
-        except Exception as e:
-            logger.error(f"Docker cleanup failed: {str(e)}")
-            raise MCPDevServerError(f"Docker cleanup failed: {str(e)}")
+        results = await asyncio.gather(
+            *(
+                self.stop_container(environment)
+                for environment in list(self.active_containers.keys())
+            ),
+            return_exceptions=True
+        )
+
+        errors = [str(e) for e in results if isinstance(e, Exception)]
+        if errors:
+            logger.error("Docker cleanup failed: %s", '; '.join(errors))
+            raise MCPDevServerError(f"Docker cleanup failed: {'; '.join(errors)}")
             
     def get_logs(self, env_id: str, tail: Optional[int] = None) -> str:
         """Get container logs.
@@ -246,5 +554,5 @@ class DockerManager:
             return container.logs(tail=tail).decode()
             
         except Exception as e:
-            logger.error(f"Failed to get logs: {str(e)}")
+            logger.error("Failed to get logs: %s", e)
             raise MCPDevServerError(f"Log retrieval failed: {str(e)}")
@@ -3,6 +3,7 @@ from typing import Dict, List, Optional
 import docker
 from docker.errors import DockerException
 
+from .manager import get_docker_client
 from ..utils.logging import setup_logging
 from ..utils.errors import DockerError
 
@@ -10,9 +11,16 @@ logger = setup_logging(__name__)
 
 class VolumeManager:
     """Manages Docker volumes for development environments."""
-    
+
     def __init__(self):
-        self.client = docker.from_env()
+        self._client: Optional[docker.DockerClient] = None
+
+    @property
+    def client(self) -> docker.DockerClient:
+        """Shared Docker client, connected on first use."""
+        if self._client is None:
+            self._client = get_docker_client()
+        return self._client
         
     async def create_volume(
         self,
@@ -1,6 +1,8 @@
 """Environment management for MCP Development Server."""
+import asyncio
 import os
 import json
+import shutil
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
@@ -93,7 +95,6 @@ class EnvironmentManager:
                     await self.volume_manager.remove_volume(volume)
                 
                 # Remove environment directory
-                import shutil
                 shutil.rmtree(env['path'])
                 
                 # Remove from environments dict
@@ -162,8 +163,12 @@ class EnvironmentManager:
                 
     async def cleanup(self) -> None:
         """Clean up all environments."""
-        for name in list(self.environments.keys()):
+        async def remove(name: str) -> None:
             try:
                 await self.remove_environment(name)
             except Exception as e:
                 logger.error(f"Error cleaning up environment {name}: {str(e)}")
+
+        await asyncio.gather(
+            *(remove(name) for name in list(self.environments.keys()))
+        )
@@ -1,5 +1,10 @@
 """Base project class definition."""
+import asyncio
 import os
+import shlex
+import subprocess
+import threading
+import time
 import uuid
 import xml.etree.ElementTree as ET
 import json
@@ -14,6 +19,9 @@ from ..utils.logging import setup_logging
 
 logger = setup_logging(__name__)
 
+# Seconds before a cached project structure is considered stale
+STRUCTURE_CACHE_TTL = 5.0
+
 class Project:
     """Base project class."""
     
@@ -24,6 +32,8 @@ class Project:
         self.config = config
         self.project_type = project_type
         self.build_system = BuildSystem(config["build_system"])
+        self._structure_cache: Optional[tuple] = None
+        self._structure_refreshing = False
         
     def get_dependencies(self) -> Dict[str, Any]:
         """Get project dependencies."""
@@ -173,6 +183,35 @@ class Project:
             
         return await self.execute_command(cmd)
 
+    async def execute_command(self, command: str) -> Dict[str, Any]:
+        """Execute a build tool command in the project directory.
+
+        Spawns the process directly instead of going through a shell, so
+        no intermediate /bin/sh is forked per command.
+
+        Args:
+            command: Command line to execute
+
+        Returns:
+            Dict[str, Any]: Exit code and captured output lines
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *shlex.split(command),
+                cwd=self.path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT
+            )
+            stdout, _ = await process.communicate()
+
+            return {
+                "exit_code": process.returncode,
+                "output": stdout.decode().splitlines()
+            }
+        except Exception as e:
+            logger.error(f"Command execution failed: {e}")
+            raise ProjectError(f"Command execution failed: {str(e)}")
+
     async def get_project_analysis(self) -> Dict[str, Any]:
         """Get project analysis results."""
         analysis = {
@@ -200,7 +239,42 @@ class Project:
         return analysis
 
     def get_structure(self) -> Dict[str, Any]:
-        """Get project structure."""
+        """Get project structure.
+
+        Serves the cached scan and refreshes it in the background once
+        it goes stale, so only the first caller pays for a full
+        directory walk.
+        """
+        cached = self._structure_cache
+        if cached is not None:
+            timestamp, structure = cached
+            if time.monotonic() - timestamp >= STRUCTURE_CACHE_TTL:
+                self._refresh_structure()
+            return structure
+
+        structure = self._scan_structure()
+        self._structure_cache = (time.monotonic(), structure)
+        return structure
+
+    def _refresh_structure(self) -> None:
+        """Rescan the project structure in a background thread."""
+        if self._structure_refreshing:
+            return
+        self._structure_refreshing = True
+
+        def refresh():
+            try:
+                structure = self._scan_structure()
+                self._structure_cache = (time.monotonic(), structure)
+            except Exception as e:
+                logger.error(f"Structure refresh failed: {e}")
+            finally:
+                self._structure_refreshing = False
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _scan_structure(self) -> Dict[str, Any]:
+        """Scan the project directory structure."""
         def scan_dir(path: Path) -> Dict[str, Any]:
             structure = {}
             ignore_patterns = ['.git', '__pycache__', 'node_modules', 'target', 'build']
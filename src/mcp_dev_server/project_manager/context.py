@@ -1,6 +1,7 @@
 """Project context management for MCP Development Server."""
 import os
 import json
+import orjson
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -62,8 +63,11 @@ class ProjectContext:
                 
             # Create basic configuration files
             config_path = os.path.join(self.path, '.mcp', 'project.json')
-            with open(config_path, 'w') as f:
-                json.dump(self.config.dict(), f, indent=2, default=str)
+            with open(config_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.config.model_dump(mode="json"),
+                    option=orjson.OPT_INDENT_2
+                ))
                 
         except Exception as e:
             raise FileOperationError(f"Failed to create project structure: {str(e)}")
@@ -72,8 +76,11 @@ class ProjectContext:
         """Initialize project state file."""
         try:
             state_path = os.path.join(self.path, '.mcp', 'state.json')
-            with open(state_path, 'w') as f:
-                json.dump(self.state.dict(), f, indent=2, default=str)
+            with open(state_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.state.model_dump(mode="json"),
+                    option=orjson.OPT_INDENT_2
+                ))
                 
         except Exception as e:
             raise FileOperationError(f"Failed to initialize state file: {str(e)}")
@@ -180,8 +187,11 @@ class ProjectContext:
                     
             # Save to state file
             state_path = os.path.join(self.path, '.mcp', 'state.json')
-            with open(state_path, 'w') as f:
-                json.dump(self.state.dict(), f, indent=2, default=str)
+            with open(state_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.state.model_dump(mode="json"),
+                    option=orjson.OPT_INDENT_2
+                ))
                 
             logger.info(f"Updated project state: {kwargs}")
             
@@ -28,6 +28,9 @@ class ProjectManager:
         self.docker_manager = DockerManager()
         self.current_project = None
         self.projects = {}
+        # Parallel lightweight index so listings never touch full
+        # Project instances
+        self._project_summaries: Dict[str, Dict[str, Any]] = {}
         
     def get_available_project_types(self) -> Dict[str, Dict[str, Any]]:
         """Get list of available project types.
@@ -45,6 +48,14 @@ class ProjectManager:
             for name, pt in PROJECT_TYPES.items()
         }
         
+    def list_projects(self) -> List[Dict[str, Any]]:
+        """Get summaries of all managed projects.
+
+        Returns:
+            List[Dict[str, Any]]: Project summary information
+        """
+        return list(self._project_summaries.values())
+
     async def create_project(
         self,
         name: str,
@@ -77,11 +88,13 @@ class ProjectManager:
                 path = str(projects_dir / name)
                 
             project_path = Path(path)
-            if project_path.exists():
+
+            # Create project directory; a single mkdir doubles as the
+            # existence check instead of a separate stat
+            try:
+                project_path.mkdir(parents=True, exist_ok=False)
+            except FileExistsError:
                 raise ProjectError(f"Project path already exists: {path}")
-                
-            # Create project directory
-            project_path.mkdir(parents=True, exist_ok=True)
             
             # Create project configuration
             project_config.update({
@@ -97,16 +110,23 @@ class ProjectManager:
             with open(config_path, "w") as f:
                 json.dump(project_config, f, indent=2)
                 
+            # Fork: repository init only touches .git, so it can run
+            # alongside file generation
+            loop = asyncio.get_running_loop()
+            git_task = None
+            if project_config.get("initialize_git", True):
+                git_task = loop.run_in_executor(None, git.Repo.init, path)
+
             # Create project structure
             await self._create_project_structure(project_path, project_type_info)
-            
+
             # Initialize build system
             await self._initialize_build_system(
-                project_path, 
-                project_type_info, 
+                project_path,
+                project_type_info,
                 project_config
             )
-            
+
             # Set up Docker environment if requested
             if project_config.get("setup_docker", False):
                 await self._setup_docker_environment(
@@ -114,13 +134,17 @@ class ProjectManager:
                     project_type_info,
                     project_config
                 )
-                
-            # Initialize Git repository if requested
-            if project_config.get("initialize_git", True):
-                repo = git.Repo.init(path)
-                repo.index.add("*")
-                repo.index.commit("Initial commit")
-                
+
+            # Join: commit once the generated files exist
+            if git_task is not None:
+                repo = await git_task
+
+                def initial_commit():
+                    repo.index.add("*")
+                    repo.index.commit("Initial commit")
+
+                await loop.run_in_executor(None, initial_commit)
+
             # Create project instance
             project = await self._create_project_instance(
                 path,
@@ -131,6 +155,13 @@ class ProjectManager:
             # Store project reference
             self.projects[project.id] = project
             self.current_project = project
+            self._project_summaries[project.id] = {
+                "id": project.id,
+                "name": name,
+                "type": project_type,
+                "path": path,
+                "description": description
+            }
             
             logger.info(f"Created {project_type} project: {name} at {path}")
             return project
@@ -1,18 +1,40 @@
 """Project representation and management."""
+import json
 import uuid
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 import git
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, ConfigDict
 
 class ProjectConfig(BaseModel):
     """Project configuration model."""
-    
+
+    model_config = ConfigDict(frozen=True)
+
     name: str
     template: str
     description: str = ""
     version: str = "0.1.0"
-    
+
+    @classmethod
+    def from_file(cls, path: str) -> "ProjectConfig":
+        """Load project configuration from a JSON file.
+
+        Parses the raw bytes with orjson instead of going through the
+        stdlib json decoder. The file is written by this server, so the
+        fields are trusted and loaded with model_construct, skipping
+        per-field validation.
+
+        Args:
+            path: Path to the configuration file
+
+        Returns:
+            ProjectConfig: Loaded configuration
+        """
+        with open(path, "rb") as f:
+            return cls.model_construct(**orjson.loads(f.read()))
+
 class ProjectState:
     """Project state tracking."""
     
@@ -135,7 +157,6 @@ class Project:
         # Check Node.js dependencies
         package_file = Path(self.path) / "package.json"
         if package_file.exists():
-            import json
             with open(package_file, "r") as f:
                 package_data = json.load(f)
                 dependencies["node"] = {
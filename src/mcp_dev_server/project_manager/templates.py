@@ -1,8 +1,9 @@
 """Template system for project creation."""
+import asyncio
 import os
 import shutil
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set, Tuple
 import jinja2
 import yaml
 
@@ -17,9 +18,16 @@ class TemplateManager:
     def __init__(self):
         """Initialize template manager."""
         self.template_dir = self._get_template_dir()
+        self._config_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # Persist compiled templates so repeated loads skip recompilation
+        cache_dir = self.template_dir / ".jinja_cache"
+        cache_dir.mkdir(exist_ok=True)
+
         self.env = jinja2.Environment(
             loader=jinja2.FileSystemLoader(str(self.template_dir)),
-            autoescape=jinja2.select_autoescape()
+            autoescape=jinja2.select_autoescape(),
+            bytecode_cache=jinja2.FileSystemBytecodeCache(str(cache_dir))
         )
         
     def _get_template_dir(self) -> Path:
@@ -157,37 +165,131 @@ MANIFEST
                 raise ProjectError(f"Template not found: {template_name}")
                 
             # Load template configuration
-            with open(template_path / "template.yaml", "r") as f:
-                template_config = yaml.safe_load(f)
-                
+            template_config = self._load_template_config(template_path / "template.yaml")
+
             # Prepare template variables
             variables = {
                 "project_name": project.config.name,
                 "description": project.config.description
             }
             
-            # Process each template file
-            for file_path in template_config["files"]:
-                template_file = template_path / file_path
-                if template_file.exists():
-                    # Create target directory if needed
-                    target_path = Path(project.path) / file_path
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Render template content
-                    template = self.env.get_template(f"{template_name}/{file_path}")
-                    content = template.render(**variables)
-                    
-                    # Write rendered content
-                    with open(target_path, "w") as f:
-                        f.write(content)
-                        
+            # Collect the template's files in one scandir pass instead of
+            # stat-ing each declared file individually
+            available_files = self._scan_template_files(template_path)
+            files = [f for f in template_config["files"] if f in available_files]
+
+            # Create all target directories up front
+            for parent in {(Path(project.path) / f).parent for f in files}:
+                parent.mkdir(parents=True, exist_ok=True)
+
+            # Files with no Jinja syntax skip rendering and take the
+            # zero-copy path instead
+            render_files = []
+            static_files = []
+            for f in files:
+                data = (template_path / f).read_bytes()
+                if b"{{" in data or b"{%" in data:
+                    render_files.append(f)
+                else:
+                    static_files.append(f)
+
+            # Load all templates in one batch so the render workers only
+            # touch compiled templates
+            templates = {
+                f: self.env.get_template(f"{template_name}/{f}")
+                for f in render_files
+            }
+
+            def copy_file(file_path: str) -> None:
+                source_path = template_path / file_path
+                target_path = Path(project.path) / file_path
+
+                try:
+                    if target_path.read_bytes() == source_path.read_bytes():
+                        return
+                except OSError:
+                    pass
+
+                # copyfile copies inside the kernel (sendfile/
+                # copy_file_range) instead of shuttling bytes through
+                # Python
+                shutil.copyfile(source_path, target_path)
+
+            def render_file(file_path: str) -> None:
+                # Render template content
+                content = templates[file_path].render(**variables)
+                target_path = Path(project.path) / file_path
+
+                # Skip the write when the target already matches,
+                # rsync-style, so re-applying a template only touches
+                # changed files
+                try:
+                    if target_path.read_text() == content:
+                        return
+                except OSError:
+                    pass
+
+                # Write rendered content
+                with open(target_path, "w") as f:
+                    f.write(content)
+
+            # Render and copy template files concurrently
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *(loop.run_in_executor(None, render_file, f) for f in render_files),
+                *(loop.run_in_executor(None, copy_file, f) for f in static_files)
+            )
+
+
             logger.info(f"Applied template {template_name} to project {project.config.name}")
             
         except Exception as e:
             logger.error(f"Failed to apply template: {str(e)}")
             raise ProjectError(f"Template application failed: {str(e)}")
             
+    def _load_template_config(self, config_path: Path) -> Dict[str, Any]:
+        """Load a template configuration, reusing cached parses.
+
+        Args:
+            config_path: Path to template.yaml
+
+        Returns:
+            Dict[str, Any]: Parsed template configuration
+        """
+        mtime = config_path.stat().st_mtime
+        cached = self._config_cache.get(str(config_path))
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with open(config_path, "r") as f:
+            config = yaml.safe_load(f)
+
+        self._config_cache[str(config_path)] = (mtime, config)
+        return config
+
+    def _scan_template_files(self, template_path: Path) -> Set[str]:
+        """Collect relative paths of all files in a template directory.
+
+        Args:
+            template_path: Template directory path
+
+        Returns:
+            Set[str]: Relative file paths found in the template
+        """
+        files: Set[str] = set()
+        stack = [template_path]
+
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.is_file():
+                        files.add(Path(entry.path).relative_to(template_path).as_posix())
+
+        return files
+
     async def template_has_git(self, template_name: str) -> bool:
         """Check if template includes Git initialization.
         
@@ -203,9 +305,8 @@ MANIFEST
                 return False
                 
             # Load template configuration
-            with open(template_path / "template.yaml", "r") as f:
-                template_config = yaml.safe_load(f)
-                
+            template_config = self._load_template_config(template_path / "template.yaml")
+
             return template_config.get("features", {}).get("git", False)
             
         except Exception:
@@ -223,8 +324,6 @@ MANIFEST
             if template_dir.is_dir():
                 config_path = template_dir / "template.yaml"
                 if config_path.exists():
-                    with open(config_path, "r") as f:
-                        config = yaml.safe_load(f)
-                        templates.append(config)
-                        
+                    templates.append(self._load_template_config(config_path))
+
         return templates
\ No newline at end of file
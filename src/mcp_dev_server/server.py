@@ -1,5 +1,6 @@
 """MCP Development Server implementation."""
-from typing import Dict, Any, Optional, Sequence
+from typing import Dict, Any, Optional, Sequence, TypedDict
+import asyncio
 import logging
 import sys
 import json
@@ -28,6 +29,45 @@ handler.setFormatter(formatter)
 logger.addHandler(handler)
 logger.setLevel(logging.DEBUG)  # Set to DEBUG for development
 
+# Fixed responses are built once at import; constructing TextContent
+# models per request is measurable on the hot dispatch path
+_UNKNOWN_TOOL_RESPONSE = [types.TextContent(type="text", text="Unknown tool")]
+
+# Precomputed scheme prefix; validating with one startswith beats
+# splitting the URI first. MCP hands us str, so the comparison stays at
+# the str level rather than bytes
+_PROJECT_SCHEME_PREFIX = "project://"
+_PROJECT_SCHEME_PREFIX_LEN = len(_PROJECT_SCHEME_PREFIX)
+_TOOL_FAILURE_RESPONSE = [types.TextContent(type="text", text="Tool execution failed")]
+
+class ToolArguments(TypedDict, total=False):
+    """Arguments passed to tool handlers.
+
+    The protocol layer delivers plain dicts; typing them as a TypedDict
+    documents the expected keys and lets static checkers verify access
+    with no runtime cost.
+    """
+    environment: str
+    command: str
+    project: str
+
+def _parse_resource_uri(uri: str) -> tuple[str, str]:
+    """Split a resource URI into scheme and path.
+
+    A single str.partition call replaces chained replace/strip/split
+    string churn on this per-request path.
+
+    Args:
+        uri: Resource URI
+
+    Returns:
+        tuple[str, str]: (scheme, path); scheme is empty when missing
+    """
+    scheme, sep, path = str(uri).partition("://")
+    if not sep:
+        return "", str(uri)
+    return scheme, path
+
 class MCPDevServer:
     """MCP Development Server implementation."""
     
@@ -50,16 +90,33 @@ class MCPDevServer:
             self.test_manager = TestManager()
             self.workflow_manager = WorkflowManager()
             self.input_handler = InputRequestHandler()
-            
+
+            # Tool schemas are built lazily on the first list_tools call
+            # and cached for every call after that
+            self._tools: Optional[list[types.Tool]] = None
+
+            # Tool name -> handler coroutine; call_tool dispatches with
+            # a single dict lookup
+            self._tool_handlers: Dict[str, Any] = {}
+
+            # In-flight resource reads by URI so concurrent identical
+            # requests share one task
+            self._inflight_reads: Dict[str, asyncio.Task] = {}
+
             # Setup request handlers
             self._setup_resource_handlers()
             self._setup_tool_handlers()
             self._setup_prompt_handlers()
-            
+
+            # Capability negotiation options are derived from the
+            # registered handlers, so build them once now instead of on
+            # every run
+            self._initialization_options = self.server.create_initialization_options()
+
             logger.info("Server initialization completed successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize server: {e}")
+            logger.error("Failed to initialize server: %s", e)
             raise
 
     def _setup_resource_handlers(self):
@@ -73,22 +130,74 @@ class MCPDevServer:
         @self.server.read_resource()
         async def read_resource(uri: str) -> str:
             """Read resource content."""
-            logger.debug(f"Reading resource: {uri}")
+            key = str(uri)
+            task = self._inflight_reads.get(key)
+            if task is None:
+                task = asyncio.create_task(self._read_resource(key))
+                self._inflight_reads[key] = task
+                task.add_done_callback(
+                    lambda _: self._inflight_reads.pop(key, None)
+                )
+            return await task
+
+    async def _read_resource(self, uri: str) -> str:
+        """Read resource content for a single URI.
+
+        Args:
+            uri: Resource URI
+
+        Returns:
+            str: Resource content
+        """
+        # Fast-path validation of the only supported scheme
+        if uri.startswith(_PROJECT_SCHEME_PREFIX):
+            path = uri[_PROJECT_SCHEME_PREFIX_LEN:]
+            logger.debug("Reading project resource: %s", path)
             return ""
 
+        scheme, path = _parse_resource_uri(uri)
+        logger.debug("Unsupported resource scheme: %r (%r)", scheme, path)
+        return ""
+
+    def _build_tool_schemas(self) -> list[types.Tool]:
+        """Build the tool schema list.
+
+        Only called from the first list_tools request, so startup never
+        pays for schema construction.
+
+        Returns:
+            list[types.Tool]: Tool schemas
+        """
+        return []
+
     def _setup_tool_handlers(self):
         """Set up tool request handlers."""
         @self.server.list_tools()
         async def list_tools() -> list[types.Tool]:
             """List available tools."""
             logger.debug("Listing tools")
-            return []
+            if self._tools is None:
+                self._tools = self._build_tool_schemas()
+            return self._tools
 
         @self.server.call_tool()
-        async def call_tool(name: str, arguments: Dict[str, Any]) -> Sequence[types.TextContent]:
+        async def call_tool(name: str, arguments: ToolArguments) -> Sequence[types.TextContent]:
             """Execute a tool."""
-            logger.debug(f"Calling tool {name} with arguments {arguments}")
-            return [types.TextContent(type="text", text="Tool execution result")]
+            logger.debug("Calling tool %s with arguments %s", name, arguments)
+            handler = self._tool_handlers.get(name)
+            if handler is None:
+                logger.debug("Unknown tool: %s", name)
+                return _UNKNOWN_TOOL_RESPONSE
+
+            try:
+                return await handler(arguments)
+            except MCPDevServerError as e:
+                # Expected failures already carry a user-facing message;
+                # reuse it without any traceback formatting
+                return [types.TextContent(type="text", text=str(e))]
+            except Exception:
+                logger.exception("Tool %s failed", name)
+                return _TOOL_FAILURE_RESPONSE
 
     def _setup_prompt_handlers(self):
         """Set up prompt request handlers."""
@@ -98,10 +207,38 @@ class MCPDevServer:
             logger.debug("Listing prompts")
             return []
 
+    async def cleanup(self):
+        """Clean up server resources.
+
+        Manager cleanups are independent of each other, so they run
+        concurrently instead of awaiting one at a time.
+        """
+        managers = (
+            self.project_manager,
+            self.template_manager,
+            self.build_manager,
+            self.dependency_manager,
+            self.test_manager,
+            self.workflow_manager,
+        )
+
+        results = await asyncio.gather(
+            *(
+                manager.cleanup()
+                for manager in managers
+                if hasattr(manager, "cleanup")
+            ),
+            return_exceptions=True
+        )
+
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Manager cleanup failed: %s", result)
+
     async def run(self):
         """Run the MCP Development Server."""
         try:
-            logger.info(f"Starting {self.server.name}...")
+            logger.info("Starting %s...", self.server.name)
             
             # Use stdio transport
             async with stdio_server() as streams:
@@ -109,12 +246,12 @@ class MCPDevServer:
                 await self.server.run(
                     streams[0],  # read stream
                     streams[1],  # write stream
-                    self.server.create_initialization_options(),
+                    self._initialization_options,
                     raise_exceptions=True  # Enable for debugging
                 )
                 
         except Exception as e:
-            logger.error(f"Server error: {str(e)}")
+            logger.error("Server error: %s", e)
             raise MCPDevServerError(f"Server error: {str(e)}")
 
         finally:
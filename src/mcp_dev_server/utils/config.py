@@ -1,9 +1,26 @@
 """Configuration management for MCP Development Server."""
+import asyncio
+import functools
 import os
 import json
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+@functools.lru_cache(maxsize=None)
+def _default_config_dir() -> Path:
+    """Resolve and create the configuration directory once per process.
+
+    Returns:
+        Path: Configuration directory
+    """
+    if os.name == "nt":  # Windows
+        config_dir = Path(os.getenv("APPDATA")) / "Claude"
+    else:  # macOS/Linux
+        config_dir = Path.home() / ".config" / "claude"
+
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return config_dir
+
 class Config:
     """Configuration manager."""
     
@@ -15,13 +32,7 @@ class Config:
         
     def _get_config_dir(self) -> Path:
         """Get configuration directory path."""
-        if os.name == "nt":  # Windows
-            config_dir = Path(os.getenv("APPDATA")) / "Claude"
-        else:  # macOS/Linux
-            config_dir = Path.home() / ".config" / "claude"
-            
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir
+        return _default_config_dir()
         
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
@@ -62,12 +73,16 @@ class Config:
         """Get configuration value."""
         return self.config.get(key, default)
         
-    def set(self, key: str, value: Any):
+    async def set(self, key: str, value: Any):
         """Set configuration value."""
         self.config[key] = value
-        self._save_config(self.config)
-        
-    def update(self, updates: Dict[str, Any]):
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._save_config, self.config
+        )
+
+    async def update(self, updates: Dict[str, Any]):
         """Update multiple configuration values."""
         self.config.update(updates)
-        self._save_config(self.config)
\ No newline at end of file
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._save_config, self.config
+        )
\ No newline at end of file
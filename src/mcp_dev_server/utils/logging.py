@@ -1,22 +1,29 @@
 """Logging configuration for MCP Development Server."""
 import logging
 import sys
-from typing import Optional
+from typing import Dict, Optional
+
+# Loggers already configured by setup_logging, keyed by name
+_loggers: Dict[str, logging.Logger] = {}
 
 def setup_logging(name: Optional[str] = None, level: int = logging.INFO) -> logging.Logger:
     """Setup logging configuration.
-    
+
     Args:
         name: Logger name
         level: Logging level
-        
+
     Returns:
         logging.Logger: Configured logger instance
     """
+    logger_name = name or __name__
+    if logger_name in _loggers:
+        return _loggers[logger_name]
+
     # Create logger
-    logger = logging.getLogger(name or __name__)
+    logger = logging.getLogger(logger_name)
     logger.setLevel(level)
-    
+
     # Create stderr handler (MCP protocol requires clean stdout)
     handler = logging.StreamHandler(sys.stderr)
     handler.setLevel(level)
@@ -29,5 +36,6 @@ def setup_logging(name: Optional[str] = None, level: int = logging.INFO) -> logg
     
     # Add handler to logger
     logger.addHandler(handler)
-    
+
+    _loggers[logger_name] = logger
     return logger
\ No newline at end of file